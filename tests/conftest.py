@@ -0,0 +1,59 @@
+"""Shared fixtures for the TradingAgents test suite."""
+
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock
+
+
+def _obb_stub():
+    """Nested stand-in for the OpenBB SDK with MagicMock leaf endpoints.
+
+    Intermediate namespaces are plain SimpleNamespace attributes, avoiding
+    MagicMock's child synthesis on every attribute hop. The leaves stay
+    MagicMocks so return_value/side_effect and call assertions still work.
+    """
+    return SimpleNamespace(
+        equity=SimpleNamespace(
+            profile=MagicMock(),
+            price=SimpleNamespace(historical=MagicMock()),
+            fundamental=SimpleNamespace(
+                metrics=MagicMock(),
+                balance=MagicMock(),
+                cash=MagicMock(),
+                income=MagicMock(),
+                filings=MagicMock(),
+            ),
+            ownership=SimpleNamespace(insider_trading=MagicMock()),
+        ),
+        news=SimpleNamespace(company=MagicMock(), world=MagicMock()),
+        economy=SimpleNamespace(fred_series=MagicMock()),
+    )
+
+@pytest.fixture(scope="session")
+def ta_interface():
+    """The dataflows interface module, resolved once per session."""
+    from tradingagents.dataflows import interface
+    return interface
+
+
+@pytest.fixture(scope="session")
+def ta_default_config():
+    """The DEFAULT_CONFIG dict, resolved once per session."""
+    from tradingagents.default_config import DEFAULT_CONFIG
+    return DEFAULT_CONFIG
+
+
+@pytest.fixture
+def patched_obb(monkeypatch):
+    """Patch _get_obb to return a pre-wired stub OpenBB SDK object."""
+    import tradingagents.dataflows.openbb_provider as provider
+
+    provider._CACHE.clear()  # keep TTL-cached responses from leaking across tests
+    provider._INFLIGHT.clear()
+    monkeypatch.setattr(provider, "_disk_cache", None)  # tests stay network-shaped
+    stub = _obb_stub()
+    monkeypatch.setattr(
+        "tradingagents.dataflows.openbb_provider._get_obb", lambda: stub
+    )
+    return stub
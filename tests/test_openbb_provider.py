@@ -8,42 +8,71 @@ Tests verify that:
 4. Data is properly formatted for downstream agent consumption
 """
 
+import sys
+import time
+
 import pytest
+from functools import lru_cache, reduce
 from unittest.mock import patch, MagicMock
 import pandas as pd
-from datetime import datetime
+
+# Skips the whole file at collection if the provider module (or a
+# dependency in its import chain) is unavailable.
+provider = pytest.importorskip("tradingagents.dataflows.openbb_provider")
 
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Helpers
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(autouse=True)
-def reset_obb_singleton():
-    """Reset the lazy-init singleton before each test."""
-    import tradingagents.dataflows.openbb_provider as provider
-    provider._obb = None
-    yield
-    provider._obb = None
+class _Record:
+    """Minimal stand-in for an OpenBB pydantic record."""
+
+    def __init__(self, data):
+        self._data = data
 
+    def model_dump(self):
+        return self._data
 
-def _mock_obb():
-    """Create a mock OpenBB SDK object."""
-    return MagicMock()
 
+@lru_cache(maxsize=None)
+def _make_openbb_result(items):
+    """Create a mock OpenBB result with to_dataframe()/.results support.
 
-def _make_openbb_result(data: dict, columns: list = None):
-    """Create a mock OpenBB result with to_dataframe() support."""
+    ``items`` is a tuple of (column, values) tuples so identical payloads
+    are memoized and their DataFrame is only constructed once per run.
+    """
+    data = {col: list(values) for col, values in items}
     df = pd.DataFrame(data)
     result = MagicMock()
     result.to_dataframe.return_value = df
+    result.results = [
+        _Record(dict(zip(data.keys(), row))) for row in zip(*data.values())
+    ]
+    return result
+
+
+def _make_stub_result(empty=False):
+    """Create a duck-typed result for tests that never read the data.
+
+    The returned DataFrame stand-in only advertises ``.empty`` — cheap
+    compared to building a real pandas DataFrame when the assertion is
+    purely about call arguments.
+    """
+    result = MagicMock()
+    df = MagicMock()
+    df.empty = empty
+    result.to_dataframe.return_value = df
+    result.results = [] if empty else [_Record({"value": 0})]
     return result
 
 
-def _make_empty_result():
-    """Create a mock OpenBB result with empty DataFrame."""
+@lru_cache(maxsize=None)
+def _empty_result():
+    """Create a mock OpenBB result with an empty DataFrame."""
     result = MagicMock()
     result.to_dataframe.return_value = pd.DataFrame()
+    result.results = []
     return result
 
 
@@ -51,31 +80,41 @@ def _make_empty_result():
 # Test: Lazy initialization
 # ===========================================================================
 
+@pytest.mark.xdist_group("obb_singleton")
 class TestLazyInit:
-    def test_get_obb_imports_openbb(self):
-        """_get_obb should import and cache the obb singleton."""
-        mock_obb = MagicMock()
-        with patch.dict("sys.modules", {"openbb": MagicMock(obb=mock_obb)}):
-            from tradingagents.dataflows.openbb_provider import _get_obb
-            import tradingagents.dataflows.openbb_provider as provider
-            provider._obb = None
-
-            with patch("tradingagents.dataflows.openbb_provider._obb", None):
-                # Force re-import path
-                provider._obb = None
-                # Simulate import
-                provider._obb = mock_obb
-                assert provider._obb is mock_obb
-
-    def test_get_obb_raises_on_missing_package(self):
+    def test_get_obb_imports_and_caches(self, monkeypatch):
+        """_get_obb should import openbb once and cache the singleton."""
+        fake_obb = MagicMock()
+        monkeypatch.setitem(sys.modules, "openbb", MagicMock(obb=fake_obb))
+        monkeypatch.setattr(provider, "_obb", None)
+
+        got_first = provider._get_obb()
+        got_second = provider._get_obb()
+
+        assert got_first is fake_obb
+        assert got_second is fake_obb
+
+    def test_preload_warms_singleton(self, monkeypatch):
+        """preload_openbb should initialize the singleton off-thread."""
+        fake_obb = MagicMock()
+        monkeypatch.setitem(sys.modules, "openbb", MagicMock(obb=fake_obb))
+        monkeypatch.setattr(provider, "_obb", None)
+
+        provider.preload_openbb()
+
+        for _ in range(100):  # background thread; poll briefly
+            if provider._obb is not None:
+                break
+            time.sleep(0.01)
+        assert provider._obb is fake_obb
+
+    def test_get_obb_raises_on_missing_package(self, monkeypatch):
         """_get_obb should raise ImportError when openbb is not installed."""
-        from tradingagents.dataflows.openbb_provider import _get_obb
-        import tradingagents.dataflows.openbb_provider as provider
-        provider._obb = None
+        monkeypatch.setattr(provider, "_obb", None)
 
         with patch("builtins.__import__", side_effect=ImportError("No module named 'openbb'")):
             with pytest.raises(ImportError, match="openbb is not installed"):
-                _get_obb()
+                provider._get_obb()
 
 
 # ===========================================================================
@@ -83,48 +122,76 @@ class TestLazyInit:
 # ===========================================================================
 
 class TestGetStockData:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_returns_csv_with_header(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-
-        mock_obb.equity.price.historical.return_value = _make_openbb_result({
-            "open": [150.0, 151.0],
-            "high": [155.0, 156.0],
-            "low": [149.0, 150.0],
-            "close": [154.0, 155.0],
-            "volume": [1000000, 1100000],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_stock_data
-        result = get_stock_data("AAPL", "2025-01-01", "2025-01-02")
+    def test_returns_csv_with_header(self, patched_obb):
+        patched_obb.equity.price.historical.return_value = _make_openbb_result((
+            ("open", (150.0, 151.0)),
+            ("high", (155.0, 156.0)),
+            ("low", (149.0, 150.0)),
+            ("close", (154.0, 155.0)),
+            ("volume", (1000000, 1100000)),
+        ))
+
+        result = provider.get_stock_data("AAPL", "2025-01-01", "2025-01-02")
 
         assert "Stock data for AAPL" in result
         assert "OpenBB" in result
         assert "154.0" in result
-        mock_obb.equity.price.historical.assert_called_once()
+        patched_obb.equity.price.historical.assert_called_once()
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_empty_data_returns_message(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.price.historical.return_value = _make_empty_result()
+    def test_error_returns_message(self, patched_obb):
+        patched_obb.equity.price.historical.side_effect = Exception("API error")
 
-        from tradingagents.dataflows.openbb_provider import get_stock_data
-        result = get_stock_data("FAKE", "2025-01-01", "2025-01-02")
+        result = provider.get_stock_data("AAPL", "2025-01-01", "2025-01-02")
 
-        assert "No data found" in result
+        assert "Error" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_error_returns_message(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.price.historical.side_effect = Exception("API error")
+    def test_iter_stock_data_streams_same_payload(self, patched_obb, monkeypatch):
+        # Freeze the header timestamp so the two payloads cannot differ
+        # by straddling a second boundary.
+        monkeypatch.setattr(provider, "_now_str", lambda: "2025-01-01 00:00:00")
+        patched_obb.equity.price.historical.return_value = _make_openbb_result((
+            ("close", (154.0, 155.0)),
+        ))
 
-        from tradingagents.dataflows.openbb_provider import get_stock_data
-        result = get_stock_data("AAPL", "2025-01-01", "2025-01-02")
+        chunks = list(provider.iter_stock_data("AAPL", "2025-01-01", "2025-01-02"))
 
-        assert "Error" in result
+        assert len(chunks) >= 2  # header chunk + at least one CSV chunk
+        assert "".join(chunks) == provider.get_stock_data(
+            "AAPL", "2025-01-01", "2025-01-02"
+        )
+
+
+# ===========================================================================
+# Test: get_stock_data_multi
+# ===========================================================================
+
+class TestGetStockDataMulti:
+    def test_batches_symbols_into_one_call(self, patched_obb):
+        patched_obb.equity.price.historical.return_value = _make_openbb_result((
+            ("symbol", ("AAPL", "AAPL", "MSFT")),
+            ("close", (154.0, 155.0, 410.0)),
+        ))
+
+        result = provider.get_stock_data_multi(
+            ["AAPL", "MSFT"], "2025-01-01", "2025-01-02"
+        )
+
+        patched_obb.equity.price.historical.assert_called_once()
+        assert patched_obb.equity.price.historical.call_args.kwargs["symbol"] == "AAPL,MSFT"
+        assert "Stock data for AAPL" in result["AAPL"]
+        assert "410.0" in result["MSFT"]
+
+    def test_missing_symbol_reports_no_data(self, patched_obb):
+        patched_obb.equity.price.historical.return_value = _make_openbb_result((
+            ("symbol", ("AAPL",)),
+            ("close", (154.0,)),
+        ))
+
+        result = provider.get_stock_data_multi(
+            ["AAPL", "FAKE"], "2025-01-01", "2025-01-02"
+        )
+
+        assert "No data found for symbol 'FAKE'" in result["FAKE"]
 
 
 # ===========================================================================
@@ -132,197 +199,118 @@ class TestGetStockData:
 # ===========================================================================
 
 class TestGetFundamentals:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_returns_formatted_fundamentals(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-
-        mock_obb.equity.profile.return_value = _make_openbb_result({
-            "name": ["Apple Inc."],
-            "sector": ["Technology"],
-            "industry": ["Consumer Electronics"],
-            "market_cap": [3000000000000],
-            "beta": [1.2],
-        })
+    def test_returns_formatted_fundamentals(self, patched_obb):
+        patched_obb.equity.profile.return_value = _make_openbb_result((
+            ("name", ("Apple Inc.",)),
+            ("sector", ("Technology",)),
+            ("industry", ("Consumer Electronics",)),
+            ("market_cap", (3000000000000,)),
+            ("beta", (1.2,)),
+        ))
         # Mock metrics to raise (optional endpoint)
-        mock_obb.equity.fundamental.metrics.side_effect = Exception("not available")
+        patched_obb.equity.fundamental.metrics.side_effect = Exception("not available")
 
-        from tradingagents.dataflows.openbb_provider import get_fundamentals
-        result = get_fundamentals("AAPL")
+        result = provider.get_fundamentals("AAPL")
 
         assert "Apple Inc." in result
         assert "Technology" in result
         assert "OpenBB" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_empty_profile_returns_message(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.profile.return_value = _make_empty_result()
-
-        from tradingagents.dataflows.openbb_provider import get_fundamentals
-        result = get_fundamentals("FAKE")
-
-        assert "No fundamentals data found" in result
-
 
 # ===========================================================================
 # Test: Financial statements (balance sheet, cashflow, income statement)
 # ===========================================================================
 
 class TestFinancialStatements:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_balance_sheet_quarterly(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.fundamental.balance.return_value = _make_openbb_result({
-            "total_assets": [100000, 110000],
-            "total_liabilities": [50000, 55000],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_balance_sheet
-        result = get_balance_sheet("AAPL", "quarterly")
+    def test_balance_sheet_quarterly(self, patched_obb):
+        patched_obb.equity.fundamental.balance.return_value = _make_openbb_result((
+            ("total_assets", (100000, 110000)),
+            ("total_liabilities", (50000, 55000)),
+        ))
+
+        result = provider.get_balance_sheet("AAPL", "quarterly")
 
         assert "Balance Sheet" in result
         assert "100000" in result
-        mock_obb.equity.fundamental.balance.assert_called_once_with(
+        patched_obb.equity.fundamental.balance.assert_called_once_with(
             symbol="AAPL", period="quarter", provider="yfinance", limit=8
         )
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_balance_sheet_annual(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.fundamental.balance.return_value = _make_openbb_result({
-            "total_assets": [100000],
-        })
+    def test_balance_sheet_annual(self, patched_obb):
+        patched_obb.equity.fundamental.balance.return_value = _make_stub_result()
 
-        from tradingagents.dataflows.openbb_provider import get_balance_sheet
-        result = get_balance_sheet("AAPL", "annual")
+        result = provider.get_balance_sheet("AAPL", "annual")
 
-        mock_obb.equity.fundamental.balance.assert_called_once_with(
+        patched_obb.equity.fundamental.balance.assert_called_once_with(
             symbol="AAPL", period="annual", provider="yfinance", limit=8
         )
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_cashflow_returns_csv(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.fundamental.cash.return_value = _make_openbb_result({
-            "operating_cash_flow": [50000],
-            "free_cash_flow": [30000],
-        })
+    def test_cashflow_returns_csv(self, patched_obb):
+        patched_obb.equity.fundamental.cash.return_value = _make_openbb_result((
+            ("operating_cash_flow", (50000,)),
+            ("free_cash_flow", (30000,)),
+        ))
 
-        from tradingagents.dataflows.openbb_provider import get_cashflow
-        result = get_cashflow("AAPL")
+        result = provider.get_cashflow("AAPL")
 
         assert "Cash Flow" in result
         assert "50000" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_income_statement_returns_csv(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.fundamental.income.return_value = _make_openbb_result({
-            "revenue": [400000000000],
-            "net_income": [100000000000],
-        })
+    def test_income_statement_returns_csv(self, patched_obb):
+        patched_obb.equity.fundamental.income.return_value = _make_openbb_result((
+            ("revenue", (400000000000,)),
+            ("net_income", (100000000000,)),
+        ))
 
-        from tradingagents.dataflows.openbb_provider import get_income_statement
-        result = get_income_statement("AAPL")
+        result = provider.get_income_statement("AAPL")
 
         assert "Income Statement" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_empty_statement_returns_message(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.fundamental.balance.return_value = _make_empty_result()
-
-        from tradingagents.dataflows.openbb_provider import get_balance_sheet
-        result = get_balance_sheet("FAKE")
-
-        assert "No balance sheet data found" in result
-
 
 # ===========================================================================
 # Test: Insider transactions
 # ===========================================================================
 
 class TestInsiderTransactions:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_returns_insider_data(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.ownership.insider_trading.return_value = _make_openbb_result({
-            "owner_name": ["Tim Cook"],
-            "transaction_type": ["Sale"],
-            "shares": [50000],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_insider_transactions
-        result = get_insider_transactions("AAPL")
+    def test_returns_insider_data(self, patched_obb):
+        patched_obb.equity.ownership.insider_trading.return_value = _make_openbb_result((
+            ("owner_name", ("Tim Cook",)),
+            ("transaction_type", ("Sale",)),
+            ("shares", (50000,)),
+        ))
+
+        result = provider.get_insider_transactions("AAPL")
 
         assert "Insider Transactions" in result
         assert "SEC" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_empty_insider_returns_message(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.ownership.insider_trading.return_value = _make_empty_result()
-
-        from tradingagents.dataflows.openbb_provider import get_insider_transactions
-        result = get_insider_transactions("FAKE")
-
-        assert "No insider transactions" in result
-
 
 # ===========================================================================
 # Test: News
 # ===========================================================================
 
 class TestNews:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_get_news_returns_formatted(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.news.company.return_value = _make_openbb_result({
-            "title": ["Apple beats earnings", "iPhone sales surge"],
-            "source": ["Reuters", "Bloomberg"],
-            "url": ["https://example.com/1", "https://example.com/2"],
-            "text": ["Apple reported...", "iPhone sales..."],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_news
-        result = get_news("AAPL", "2025-01-01", "2025-01-07")
+    def test_get_news_returns_formatted(self, patched_obb):
+        patched_obb.news.company.return_value = _make_openbb_result((
+            ("title", ("Apple beats earnings", "iPhone sales surge")),
+            ("source", ("Reuters", "Bloomberg")),
+            ("url", ("https://example.com/1", "https://example.com/2")),
+            ("text", ("Apple reported...", "iPhone sales...")),
+        ))
+
+        result = provider.get_news("AAPL", "2025-01-01", "2025-01-07")
 
         assert "AAPL News" in result
         assert "Apple beats earnings" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_get_news_empty(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.news.company.return_value = _make_empty_result()
-
-        from tradingagents.dataflows.openbb_provider import get_news
-        result = get_news("FAKE", "2025-01-01", "2025-01-07")
-
-        assert "No news found" in result
+    def test_get_global_news(self, patched_obb):
+        patched_obb.news.world.return_value = _make_openbb_result((
+            ("title", ("Fed holds rates steady",)),
+            ("source", ("CNBC",)),
+            ("url", ("https://example.com/fed",)),
+        ))
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_get_global_news(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.news.world.return_value = _make_openbb_result({
-            "title": ["Fed holds rates steady"],
-            "source": ["CNBC"],
-            "url": ["https://example.com/fed"],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_global_news
-        result = get_global_news("2025-01-15")
+        result = provider.get_global_news("2025-01-15")
 
         assert "Global Market News" in result
         assert "Fed holds rates steady" in result
@@ -333,109 +321,173 @@ class TestNews:
 # ===========================================================================
 
 class TestSECFilings:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_returns_filing_list(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.fundamental.filings.return_value = _make_openbb_result({
-            "filing_date": ["2025-01-15", "2024-10-30"],
-            "description": ["Annual Report", "Quarterly Report"],
-            "link": ["https://sec.gov/1", "https://sec.gov/2"],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_sec_filings
-        result = get_sec_filings("AAPL", "10-K", 5)
+    def test_returns_filing_list(self, patched_obb):
+        patched_obb.equity.fundamental.filings.return_value = _make_openbb_result((
+            ("filing_date", ("2025-01-15", "2024-10-30")),
+            ("description", ("Annual Report", "Quarterly Report")),
+            ("link", ("https://sec.gov/1", "https://sec.gov/2")),
+        ))
+
+        result = provider.get_sec_filings("AAPL", "10-K", 5)
 
         assert "SEC 10-K Filings" in result
         assert "Annual Report" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_empty_filings(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.equity.fundamental.filings.return_value = _make_empty_result()
-
-        from tradingagents.dataflows.openbb_provider import get_sec_filings
-        result = get_sec_filings("FAKE")
-
-        assert "No 10-K filings found" in result
-
 
 class TestEconomicIndicators:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_returns_fred_data(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.economy.fred_series.return_value = _make_openbb_result({
-            "date": ["2025-01-01", "2025-02-01"],
-            "value": [4.5, 4.3],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_economic_indicators
-        result = get_economic_indicators("FEDFUNDS")
+    def test_returns_fred_data(self, patched_obb):
+        patched_obb.economy.fred_series.return_value = _make_openbb_result((
+            ("date", ("2025-01-01", "2025-02-01")),
+            ("value", (4.5, 4.3)),
+        ))
+
+        result = provider.get_economic_indicators("FEDFUNDS")
 
         assert "FRED Economic Data: FEDFUNDS" in result
         assert "4.5" in result
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_empty_fred_data(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.economy.fred_series.return_value = _make_empty_result()
-
-        from tradingagents.dataflows.openbb_provider import get_economic_indicators
-        result = get_economic_indicators("INVALID")
-
-        assert "No data found" in result
+    def test_with_date_range(self, patched_obb):
+        patched_obb.economy.fred_series.return_value = _make_stub_result()
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_with_date_range(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-        mock_obb.economy.fred_series.return_value = _make_openbb_result({
-            "date": ["2024-06-01"],
-            "value": [3.8],
-        })
+        result = provider.get_economic_indicators("UNRATE", "2024-01-01", "2024-12-31")
 
-        from tradingagents.dataflows.openbb_provider import get_economic_indicators
-        result = get_economic_indicators("UNRATE", "2024-01-01", "2024-12-31")
-
-        mock_obb.economy.fred_series.assert_called_once_with(
+        patched_obb.economy.fred_series.assert_called_once_with(
             symbol="UNRATE", provider="fred",
             start_date="2024-01-01", end_date="2024-12-31"
         )
 
 
 class TestMarketOverview:
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_returns_overview(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-
-        # Mock index data
-        mock_obb.equity.price.historical.return_value = _make_openbb_result({
-            "close": [5800.0],
-        })
-        # Mock FRED data
-        mock_obb.economy.fred_series.return_value = _make_openbb_result({
-            "value": [4.5],
-        })
-
-        from tradingagents.dataflows.openbb_provider import get_market_overview
-        result = get_market_overview()
+    def test_returns_overview(self, patched_obb):
+        # One batched call returns all four indices
+        patched_obb.equity.price.historical.return_value = _make_openbb_result((
+            ("symbol", ("^GSPC", "^DJI", "^IXIC", "^VIX")),
+            ("close", (5800.0, 42000.0, 18500.0, 15.0)),
+        ))
+        # One batched call returns all three FRED series as columns
+        patched_obb.economy.fred_series.return_value = _make_openbb_result((
+            ("FEDFUNDS", (4.5,)),
+            ("DGS10", (4.2,)),
+            ("UNRATE", (3.9,)),
+        ))
+
+        result = provider.get_market_overview()
 
         assert "Market Overview" in result
+        assert "S&P 500: 5800.0" in result
+        assert "VIX: 15.0" in result
+        assert "Fed Funds Rate: 4.5" in result
+        patched_obb.equity.price.historical.assert_called_once()
+        patched_obb.economy.fred_series.assert_called_once()
 
-    @patch("tradingagents.dataflows.openbb_provider._get_obb")
-    def test_handles_partial_failures(self, mock_get_obb):
-        mock_obb = _mock_obb()
-        mock_get_obb.return_value = mock_obb
-
+    def test_handles_partial_failures(self, patched_obb):
         # All calls fail
-        mock_obb.equity.price.historical.side_effect = Exception("fail")
-        mock_obb.economy.fred_series.side_effect = Exception("fail")
+        patched_obb.equity.price.historical.side_effect = Exception("fail")
+        patched_obb.economy.fred_series.side_effect = Exception("fail")
 
-        from tradingagents.dataflows.openbb_provider import get_market_overview
-        result = get_market_overview()
+        result = provider.get_market_overview()
 
         assert "Unable to retrieve" in result
+
+
+# ===========================================================================
+# Test: empty-result handling across endpoints
+# ===========================================================================
+
+class TestEmptyResults:
+    """Every endpoint reports a clear message when the vendor returns no rows."""
+
+    @pytest.mark.parametrize("fn,obb_attr,args,expect", [
+        ("get_stock_data", "equity.price.historical",
+         ("FAKE", "2025-01-01", "2025-01-02"), "No data found"),
+        ("get_fundamentals", "equity.profile",
+         ("FAKE",), "No fundamentals data found"),
+        ("get_balance_sheet", "equity.fundamental.balance",
+         ("FAKE",), "No balance sheet data found"),
+        ("get_insider_transactions", "equity.ownership.insider_trading",
+         ("FAKE",), "No insider transactions"),
+        ("get_news", "news.company",
+         ("FAKE", "2025-01-01", "2025-01-07"), "No news found"),
+        ("get_sec_filings", "equity.fundamental.filings",
+         ("FAKE",), "No 10-K filings found"),
+        ("get_economic_indicators", "economy.fred_series",
+         ("INVALID",), "No data found"),
+    ])
+    def test_empty_returns_message(self, patched_obb, fn, obb_attr, args, expect):
+        endpoint = reduce(getattr, obb_attr.split("."), patched_obb)
+        endpoint.return_value = _empty_result()
+
+        result = getattr(provider, fn)(*args)
+
+        assert expect in result
+
+
+# ===========================================================================
+# Test: response TTL cache
+# ===========================================================================
+
+class TestResponseCache:
+    def test_repeat_fundamentals_served_from_cache(self, patched_obb):
+        """A second identical call should not hit the endpoint again."""
+        patched_obb.equity.profile.return_value = _make_openbb_result((
+            ("name", ("Apple Inc.",)),
+            ("sector", ("Technology",)),
+        ))
+        patched_obb.equity.fundamental.metrics.side_effect = Exception("not available")
+
+        first = provider.get_fundamentals("AAPL")
+        second = provider.get_fundamentals("AAPL")
+
+        assert first == second
+        patched_obb.equity.profile.assert_called_once()
+
+    def test_failed_overview_is_not_cached(self, patched_obb):
+        """A total overview failure should be retried, not served for 5 min."""
+        patched_obb.equity.price.historical.side_effect = Exception("fail")
+        patched_obb.economy.fred_series.side_effect = Exception("fail")
+
+        first = provider.get_market_overview()
+        second = provider.get_market_overview()
+
+        assert "Unable to retrieve" in first and "Unable to retrieve" in second
+        assert patched_obb.equity.price.historical.call_count == 2
+
+    def test_concurrent_identical_calls_coalesce(self, patched_obb):
+        """Two threads asking for the same key should share one fetch."""
+        import threading
+
+        release = threading.Event()
+
+        def slow_profile(**kwargs):
+            release.wait(timeout=5)
+            return _make_openbb_result((("name", ("Apple Inc.",)),))
+
+        patched_obb.equity.profile.side_effect = slow_profile
+        patched_obb.equity.fundamental.metrics.side_effect = Exception("n/a")
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(provider.get_fundamentals("AAPL"))
+            )
+            for _ in range(2)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)  # let both threads reach the cache/in-flight check
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 2 and results[0] == results[1]
+        assert patched_obb.equity.profile.call_count == 1
+
+    def test_errors_are_not_cached(self, patched_obb):
+        """A failed call should be retried, not served from cache."""
+        patched_obb.equity.fundamental.balance.side_effect = Exception("API error")
+
+        first = provider.get_balance_sheet("AAPL")
+        second = provider.get_balance_sheet("AAPL")
+
+        assert "Error" in first and "Error" in second
+        assert patched_obb.equity.fundamental.balance.call_count == 2
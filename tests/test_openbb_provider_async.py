@@ -0,0 +1,60 @@
+"""Tests for the async wrappers around the OpenBB provider."""
+
+import asyncio
+
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+provider_async = pytest.importorskip(
+    "tradingagents.dataflows.openbb_provider_async"
+)
+
+
+class _Record:
+    def __init__(self, data):
+        self._data = data
+
+    def model_dump(self):
+        return self._data
+
+
+def _make_result(data):
+    """Mock OpenBB result with to_dataframe()/.results support."""
+    result = MagicMock()
+    result.to_dataframe.return_value = pd.DataFrame(data)
+    result.results = [
+        _Record(dict(zip(data.keys(), row))) for row in zip(*data.values())
+    ]
+    return result
+
+
+class TestAsyncVariants:
+    def test_aget_fundamentals_matches_sync_output(self, patched_obb):
+        from tradingagents.dataflows import openbb_provider
+
+        patched_obb.equity.profile.return_value = _make_result(
+            {"name": ["Apple Inc."], "sector": ["Technology"]}
+        )
+        patched_obb.equity.fundamental.metrics.side_effect = Exception("n/a")
+
+        result = asyncio.run(provider_async.aget_fundamentals("AAPL"))
+
+        assert result == openbb_provider.get_fundamentals("AAPL")
+
+    def test_aget_financials_gathers_all_reports(self, patched_obb):
+        patched_obb.equity.profile.return_value = _make_result(
+            {"name": ["Apple Inc."]}
+        )
+        patched_obb.equity.fundamental.metrics.side_effect = Exception("n/a")
+        statement = _make_result({"revenue": [100]})
+        patched_obb.equity.fundamental.balance.return_value = statement
+        patched_obb.equity.fundamental.cash.return_value = statement
+        patched_obb.equity.fundamental.income.return_value = statement
+
+        bundle = asyncio.run(provider_async.aget_financials("AAPL"))
+
+        assert set(bundle) == {
+            "fundamentals", "balance_sheet", "cashflow", "income_statement"
+        }
+        assert "Apple Inc." in bundle["fundamentals"]
@@ -7,30 +7,281 @@ All functions match the existing vendor interface signatures so they can be
 used as drop-in replacements in interface.py VENDOR_METHODS.
 """
 
+import csv
+import io
 import logging
+import os
+import threading
+import time
+
+import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
 from typing import Annotated, Optional
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
 # Lazy-init singleton — avoids import cost until first use
 _obb = None
+_obb_lock = threading.Lock()
+
+# Process-wide TTL cache for provider responses, bounded LRU so long
+# agent sessions cannot grow it without limit.
+_CACHE: OrderedDict = OrderedDict()
+_CACHE_MAX_ENTRIES = 512
+
+# Guards all reads and writes of _CACHE: move_to_end on the hit path
+# would otherwise race the eviction loop on another thread.
+_cache_lock = threading.Lock()
+
+# In-flight requests by cache key, so concurrent identical calls coalesce
+# into one fetch (single-flight) instead of racing duplicate round-trips.
+_INFLIGHT: dict = {}
+_inflight_lock = threading.Lock()
+
+# Optional SQLite-backed cache that persists historical OHLCV windows and
+# SEC filings across processes. Past price windows are immutable, so they
+# never expire; everything else gets a TTL. Without diskcache installed the
+# provider simply stays network-only.
+try:
+    import diskcache
+
+    _disk_cache = diskcache.Cache(
+        os.path.expanduser("~/.tradingagents/openbb_cache")
+    )
+except Exception:
+    _disk_cache = None
+
+# Optional Arrow-native CSV writer. When a provider can hand back an Arrow
+# table, serializing it directly skips the pandas materialization and uses
+# Arrow's C++ CSV writer. Without pyarrow the record-based path is used.
+try:
+    import pyarrow.csv as _pa_csv
+except Exception:
+    _pa_csv = None
+
+
+# Failure responses must not be cached so transient errors retry; every
+# provider function's failure string starts with one of these.
+_UNCACHEABLE_PREFIXES = ("Error", "Unable to retrieve")
+
+
+def _cacheable(value) -> bool:
+    """Whether a provider response may be stored in the TTL cache."""
+    return not (
+        isinstance(value, str) and value.startswith(_UNCACHEABLE_PREFIXES)
+    )
+
+
+def _cached(ttl):
+    """Memoize a provider function for ``ttl`` seconds, keyed on its args.
+
+    Multiple agents commonly request the same fundamentals or macro series
+    within one run; a hit turns the repeat HTTP round-trip into a dict
+    lookup. Error responses are not cached so transient failures retry.
+
+    Cache misses are single-flighted: when two threads ask for the same
+    key at once, one performs the fetch and the other waits on its
+    Future rather than issuing a duplicate request.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, frozenset(kwargs.items()))
+            now = time.monotonic()
+            with _cache_lock:
+                hit = _CACHE.get(key)
+                if hit is not None and now - hit[0] < ttl:
+                    _CACHE.move_to_end(key)
+                    return hit[1]
+
+            with _inflight_lock:
+                fut = _INFLIGHT.get(key)
+                if fut is None:
+                    fut = Future()
+                    _INFLIGHT[key] = fut
+                    leader = True
+                else:
+                    leader = False
+            if not leader:
+                return fut.result()
+
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as e:
+                fut.set_exception(e)
+                raise
+            else:
+                if _cacheable(value):
+                    with _cache_lock:
+                        _CACHE[key] = (now, value)
+                        _CACHE.move_to_end(key)
+                        while len(_CACHE) > _CACHE_MAX_ENTRIES:
+                            _CACHE.popitem(last=False)
+                fut.set_result(value)
+                return value
+            finally:
+                with _inflight_lock:
+                    _INFLIGHT.pop(key, None)
+        return wrapper
+    return decorator
+
+
+# Pre-parsed header templates — %-formatting skips re-assembling the
+# constant pieces on every response.
+_STOCK_HEADER_TMPL = (
+    "# Stock data for %s from %s to %s\n"
+    "# Total records: %d\n"
+    "# Source: OpenBB (yfinance provider)\n"
+    "# Data retrieved on: %s\n\n"
+)
+_FUNDAMENTALS_HEADER_TMPL = (
+    "# Company Fundamentals for %s\n"
+    "# Source: OpenBB\n"
+    "# Data retrieved on: %s\n\n"
+)
+_STATEMENT_HEADER_TMPL = (
+    "# %s data for %s (%s)\n"
+    "# Source: OpenBB\n"
+    "# Data retrieved on: %s\n\n"
+)
+_INSIDER_HEADER_TMPL = (
+    "# Insider Transactions data for %s\n"
+    "# Source: OpenBB (SEC)\n"
+    "# Data retrieved on: %s\n\n"
+)
+_SEC_HEADER_TMPL = (
+    "# SEC %s Filings for %s\n"
+    "# Source: OpenBB (SEC)\n"
+    "# Data retrieved on: %s\n\n"
+)
+_FRED_HEADER_TMPL = (
+    "# FRED Economic Data: %s\n"
+    "# Source: OpenBB (FRED)\n"
+    "# Showing last %d data points\n"
+    "# Data retrieved on: %s\n\n"
+)
+_OVERVIEW_HEADER_TMPL = (
+    "# Market Overview\n"
+    "# Source: OpenBB\n"
+    "# Data retrieved on: %s\n\n"
+)
+
+# Headers don't need sub-second freshness; re-format at most once a second.
+_now_cache = [0, ""]
+
+
+def _now_str() -> str:
+    """Wall-clock timestamp for response headers, cached per second."""
+    now = int(time.time())
+    if now != _now_cache[0]:
+        _now_cache[0] = now
+        _now_cache[1] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return _now_cache[1]
+
+
+def _records_to_csv(result) -> str:
+    """Serialize an OBBject's records straight to CSV text.
+
+    Goes from the pydantic models in ``result.results`` to CSV via
+    csv.DictWriter, skipping the pandas round-trip (per-column NumPy
+    allocation, index construction, dtype inference) that
+    ``to_dataframe().to_csv()`` incurs just to re-serialize.
+    """
+    rows = [r.model_dump() for r in result.results]
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+def _result_to_csv(result) -> str:
+    """Serialize an OBBject to CSV, preferring the Arrow fast path.
+
+    Falls back to the csv.DictWriter record path for providers whose
+    results do not expose an Arrow table (or when pyarrow is absent).
+    """
+    if _pa_csv is not None:
+        try:
+            table = result.to_arrow()
+            sink = io.BytesIO()
+            _pa_csv.write_csv(table, sink)
+            return sink.getvalue().decode()
+        except Exception:
+            pass
+    return _records_to_csv(result)
+
+
+# Shared keep-alive session, built once at SDK init
+_http_session = None
+
+
+def _install_pooled_transport():
+    """Best-effort: share one pooled keep-alive HTTP session across providers.
+
+    OpenBB's free providers default to fresh connections, so every call
+    pays a TCP/TLS handshake. Where a provider helper module exposes a
+    ``session`` attribute, swap in a single session with a larger
+    connection pool so repeated calls reuse open connections. Providers
+    that manage their own transport are left alone.
+    """
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        _http_session = session
+
+    import importlib
+
+    for module_name in ("openbb_sec.utils.helpers", "openbb_fred.utils.fred_helpers"):
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        if hasattr(module, "session"):
+            module.session = _http_session
+
+
+def preload_openbb() -> None:
+    """Warm the OpenBB singleton on a background thread.
+
+    OpenBB's plugin discovery makes the first import cost seconds; calling
+    this from an app startup hook moves that work off the first request
+    path. Safe to call more than once.
+    """
+    threading.Thread(target=_get_obb, daemon=True).start()
 
 
 def _get_obb():
-    """Lazy-initialize the OpenBB SDK singleton."""
+    """Lazy-initialize the OpenBB SDK singleton (thread-safe)."""
     global _obb
-    if _obb is None:
+    if _obb is not None:
+        return _obb
+    with _obb_lock:
+        if _obb is not None:  # double-checked: another thread won the race
+            return _obb
         try:
             from openbb import obb
 
             # Configure credentials from environment variables
-            import os
             fred_key = os.getenv("FRED_API_KEY") or os.getenv("OPENBB_FRED_API_KEY")
             if fred_key:
                 obb.user.credentials.fred_api_key = fred_key
 
+            try:
+                _install_pooled_transport()
+            except Exception as e:
+                logger.debug(f"Pooled HTTP transport not installed: {e}")
+
             _obb = obb
             logger.info("OpenBB SDK initialized successfully")
         except ImportError:
@@ -45,21 +296,98 @@ def _get_obb():
 # Core Stock APIs — matches get_YFin_data_online signature
 # ---------------------------------------------------------------------------
 
+# Yahoo's batch quote endpoint caps out near 99 symbols per request; stay
+# well under for safety margin.
+_MULTI_CHUNK_SIZE = 20
+
+
+# Rows per CSV chunk when streaming large frames.
+_CSV_CHUNK_ROWS = 1000
+
+
+def _iter_ohlcv_csv(df, symbol: str, start_date: str, end_date: str):
+    """Yield one symbol's OHLCV output as header + CSV chunks.
+
+    Emitting the payload in ~1000-row pieces keeps peak memory at one
+    chunk instead of the whole serialized frame; str-returning callers
+    just join the pieces.
+    """
+    # Normalize column names to match yfinance output
+    col_map = {
+        "open": "Open",
+        "high": "High",
+        "low": "Low",
+        "close": "Close",
+        "volume": "Volume",
+    }
+    df = df.rename(columns=col_map)  # missing keys are ignored
+
+    price_cols = df.columns.intersection(["Open", "High", "Low", "Close"])
+    if len(price_cols):
+        df[price_cols] = df[price_cols].round(2)
+
+    yield _STOCK_HEADER_TMPL % (
+        symbol, start_date, end_date, len(df), _now_str()
+    )
+    yield df.iloc[:_CSV_CHUNK_ROWS].to_csv()
+    for start in range(_CSV_CHUNK_ROWS, len(df), _CSV_CHUNK_ROWS):
+        yield df.iloc[start:start + _CSV_CHUNK_ROWS].to_csv(header=False)
+
+
+def _format_ohlcv_csv(df, symbol: str, start_date: str, end_date: str) -> str:
+    """Format one symbol's OHLCV DataFrame as header + CSV text."""
+    return "".join(_iter_ohlcv_csv(df, symbol, start_date, end_date))
+
+
+def _split_by_symbol(df, symbols):
+    """Split a batched historical frame into per-symbol frames."""
+    if "symbol" in df.index.names:
+        df = df.reset_index("symbol")
+    if "symbol" in df.columns:
+        return {
+            sym: group.drop(columns="symbol")
+            for sym, group in df.groupby("symbol", sort=False)
+        }
+    if len(symbols) == 1:
+        # Providers drop the symbol column for single-ticker requests.
+        return {symbols[0]: df}
+    return {}
+
+
+@_cached(ttl=3600)
+def _fetch_ohlcv_df(symbol: str, start_date: str, end_date: str):
+    """Fetch one symbol's OHLCV window as a DataFrame, memoized in-process.
+
+    get_stock_data and the streaming variant share this, so an indicator
+    or formatting call for a window that was already downloaded hits
+    memory instead of the network. ``symbol`` must be uppercased by the
+    caller so cache keys are canonical.
+    """
+    obb = _get_obb()
+    result = obb.equity.price.historical(
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        provider="yfinance",
+    )
+    return result.to_dataframe()
+
+
 def get_stock_data(
     symbol: Annotated[str, "ticker symbol of the company"],
     start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
     end_date: Annotated[str, "End date in yyyy-mm-dd format"],
 ) -> str:
     """Fetch OHLCV historical price data via OpenBB."""
-    obb = _get_obb()
+    symbol_u = symbol.upper()
+    cache_key = ("ohlcv", symbol_u, start_date, end_date)
+    if _disk_cache is not None:
+        cached = _disk_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
-        result = obb.equity.price.historical(
-            symbol=symbol.upper(),
-            start_date=start_date,
-            end_date=end_date,
-            provider="yfinance",
-        )
-        df = result.to_dataframe()
+        df = _fetch_ohlcv_df(symbol_u, start_date, end_date)
 
         if df.empty:
             return (
@@ -67,36 +395,89 @@ def get_stock_data(
                 f"between {start_date} and {end_date}"
             )
 
-        # Normalize column names to match yfinance output
-        col_map = {
-            "open": "Open",
-            "high": "High",
-            "low": "Low",
-            "close": "Close",
-            "volume": "Volume",
-        }
-        df.rename(columns={k: v for k, v in col_map.items() if k in df.columns},
-                  inplace=True)
-
-        numeric_cols = ["Open", "High", "Low", "Close"]
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = df[col].round(2)
-
-        csv_string = df.to_csv()
-        header = (
-            f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
-            f"# Total records: {len(df)}\n"
-            f"# Source: OpenBB (yfinance provider)\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        )
-        return header + csv_string
+        payload = _format_ohlcv_csv(df, symbol_u, start_date, end_date)
+
+        if _disk_cache is not None:
+            # Windows entirely in the past are immutable; keep them forever.
+            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            expire = None if end_dt.date() < datetime.now().date() else 3600
+            _disk_cache.set(cache_key, payload, expire=expire)
+
+        return payload
 
     except Exception as e:
         logger.warning(f"OpenBB get_stock_data failed for {symbol}: {e}")
         return f"Error fetching stock data for {symbol}: {str(e)}"
 
 
+def iter_stock_data(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+):
+    """Stream OHLCV data as header + CSV chunks.
+
+    Yields the same text get_stock_data returns, in pieces, for callers
+    that forward chunked input (e.g. a streaming LLM request) and do not
+    want the whole payload in memory at once. Unlike get_stock_data this
+    generator propagates fetch errors to the caller.
+    """
+    symbol_u = symbol.upper()
+    df = _fetch_ohlcv_df(symbol_u, start_date, end_date)
+
+    if df.empty:
+        yield (
+            f"No data found for symbol '{symbol}' "
+            f"between {start_date} and {end_date}"
+        )
+        return
+
+    yield from _iter_ohlcv_csv(df, symbol_u, start_date, end_date)
+
+
+def get_stock_data_multi(
+    symbols: Annotated[list, "ticker symbols of the companies"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+) -> dict:
+    """Fetch OHLCV for many tickers, batching symbols into shared requests.
+
+    OpenBB's yfinance provider accepts comma-separated symbols, so each
+    batch of up to 20 tickers costs a single HTTP round-trip instead of
+    one per symbol. Returns a dict mapping each symbol to the same
+    header + CSV string get_stock_data produces.
+    """
+    obb = _get_obb()
+    symbols = [s.upper() for s in symbols]
+    out = {}
+    for i in range(0, len(symbols), _MULTI_CHUNK_SIZE):
+        chunk = symbols[i:i + _MULTI_CHUNK_SIZE]
+        try:
+            result = obb.equity.price.historical(
+                symbol=",".join(chunk),
+                start_date=start_date,
+                end_date=end_date,
+                provider="yfinance",
+            )
+            frames = _split_by_symbol(result.to_dataframe(), chunk)
+        except Exception as e:
+            logger.warning(f"OpenBB get_stock_data_multi failed for {chunk}: {e}")
+            for sym in chunk:
+                out[sym] = f"Error fetching stock data for {sym}: {str(e)}"
+            continue
+
+        for sym in chunk:
+            sub = frames.get(sym)
+            if sub is None or sub.empty:
+                out[sym] = (
+                    f"No data found for symbol '{sym}' "
+                    f"between {start_date} and {end_date}"
+                )
+            else:
+                out[sym] = _format_ohlcv_csv(sub, sym, start_date, end_date)
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Technical Indicators — matches get_stock_stats_indicators_window signature
 # ---------------------------------------------------------------------------
@@ -124,16 +505,18 @@ def get_indicators(
 # Fundamental Data — matches get_fundamentals / get_balance_sheet / etc.
 # ---------------------------------------------------------------------------
 
+@_cached(ttl=3600)
 def get_fundamentals(
     ticker: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "current date"] = None,
 ) -> str:
     """Get company fundamentals overview via OpenBB."""
+    ticker_u = ticker.upper()
     obb = _get_obb()
     try:
         # Use OpenBB equity profile for overview
         profile = obb.equity.profile(
-            symbol=ticker.upper(), provider="yfinance"
+            symbol=ticker_u, provider="yfinance"
         )
         profile_df = profile.to_dataframe()
 
@@ -141,7 +524,6 @@ def get_fundamentals(
             return f"No fundamentals data found for symbol '{ticker}'"
 
         row = profile_df.iloc[0]
-        lines = []
         field_map = {
             "name": "Name",
             "sector": "Sector",
@@ -149,15 +531,15 @@ def get_fundamentals(
             "market_cap": "Market Cap",
             "beta": "Beta",
         }
-        for src, label in field_map.items():
-            val = row.get(src)
-            if val is not None and str(val) != "nan":
-                lines.append(f"{label}: {val}")
+        # reindex + dropna filters missing fields and NaNs in one
+        # vectorized pass instead of per-field None/"nan" checks
+        present = row.reindex(field_map.keys()).dropna()
+        lines = [f"{field_map[k]}: {v}" for k, v in present.items()]
 
         # Supplement with key metrics if available
         try:
             metrics_result = obb.equity.fundamental.metrics(
-                symbol=ticker.upper(), provider="yfinance"
+                symbol=ticker_u, provider="yfinance"
             )
             metrics_df = metrics_result.to_dataframe()
             if not metrics_df.empty:
@@ -174,18 +556,14 @@ def get_fundamentals(
                     "revenue_per_share_ttm": "Revenue Per Share (TTM)",
                     "price_to_book": "Price to Book",
                 }
-                for src, label in metric_fields.items():
-                    val = m.get(src)
-                    if val is not None and str(val) != "nan":
-                        lines.append(f"{label}: {val}")
+                present = m.reindex(metric_fields.keys()).dropna()
+                lines.extend(
+                    f"{metric_fields[k]}: {v}" for k, v in present.items()
+                )
         except Exception:
             pass  # Metrics endpoint may not be available for all providers
 
-        header = (
-            f"# Company Fundamentals for {ticker.upper()}\n"
-            f"# Source: OpenBB\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        )
+        header = _FUNDAMENTALS_HEADER_TMPL % (ticker_u, _now_str())
         return header + "\n".join(lines)
 
     except Exception as e:
@@ -193,31 +571,29 @@ def get_fundamentals(
         return f"Error retrieving fundamentals for {ticker}: {str(e)}"
 
 
+@_cached(ttl=86400)
 def get_balance_sheet(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date"] = None,
 ) -> str:
     """Get balance sheet data via OpenBB."""
+    ticker_u = ticker.upper()
     obb = _get_obb()
     try:
         period = "quarter" if freq.lower() == "quarterly" else "annual"
         result = obb.equity.fundamental.balance(
-            symbol=ticker.upper(),
+            symbol=ticker_u,
             period=period,
             provider="yfinance",
             limit=8,
         )
-        df = result.to_dataframe()
-
-        if df.empty:
+        if not result.results:
             return f"No balance sheet data found for symbol '{ticker}'"
 
-        csv_string = df.to_csv()
-        header = (
-            f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
-            f"# Source: OpenBB\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        csv_string = _result_to_csv(result)
+        header = _STATEMENT_HEADER_TMPL % (
+            "Balance Sheet", ticker_u, freq, _now_str()
         )
         return header + csv_string
 
@@ -226,31 +602,29 @@ def get_balance_sheet(
         return f"Error retrieving balance sheet for {ticker}: {str(e)}"
 
 
+@_cached(ttl=86400)
 def get_cashflow(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date"] = None,
 ) -> str:
     """Get cash flow data via OpenBB."""
+    ticker_u = ticker.upper()
     obb = _get_obb()
     try:
         period = "quarter" if freq.lower() == "quarterly" else "annual"
         result = obb.equity.fundamental.cash(
-            symbol=ticker.upper(),
+            symbol=ticker_u,
             period=period,
             provider="yfinance",
             limit=8,
         )
-        df = result.to_dataframe()
-
-        if df.empty:
+        if not result.results:
             return f"No cash flow data found for symbol '{ticker}'"
 
-        csv_string = df.to_csv()
-        header = (
-            f"# Cash Flow data for {ticker.upper()} ({freq})\n"
-            f"# Source: OpenBB\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        csv_string = _result_to_csv(result)
+        header = _STATEMENT_HEADER_TMPL % (
+            "Cash Flow", ticker_u, freq, _now_str()
         )
         return header + csv_string
 
@@ -259,31 +633,29 @@ def get_cashflow(
         return f"Error retrieving cash flow for {ticker}: {str(e)}"
 
 
+@_cached(ttl=86400)
 def get_income_statement(
     ticker: Annotated[str, "ticker symbol of the company"],
     freq: Annotated[str, "frequency: 'annual' or 'quarterly'"] = "quarterly",
     curr_date: Annotated[str, "current date"] = None,
 ) -> str:
     """Get income statement data via OpenBB."""
+    ticker_u = ticker.upper()
     obb = _get_obb()
     try:
         period = "quarter" if freq.lower() == "quarterly" else "annual"
         result = obb.equity.fundamental.income(
-            symbol=ticker.upper(),
+            symbol=ticker_u,
             period=period,
             provider="yfinance",
             limit=8,
         )
-        df = result.to_dataframe()
-
-        if df.empty:
+        if not result.results:
             return f"No income statement data found for symbol '{ticker}'"
 
-        csv_string = df.to_csv()
-        header = (
-            f"# Income Statement data for {ticker.upper()} ({freq})\n"
-            f"# Source: OpenBB\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        csv_string = _result_to_csv(result)
+        header = _STATEMENT_HEADER_TMPL % (
+            "Income Statement", ticker_u, freq, _now_str()
         )
         return header + csv_string
 
@@ -296,24 +668,19 @@ def get_insider_transactions(
     ticker: Annotated[str, "ticker symbol of the company"],
 ) -> str:
     """Get insider transactions via OpenBB (SEC provider — free)."""
+    ticker_u = ticker.upper()
     obb = _get_obb()
     try:
         result = obb.equity.ownership.insider_trading(
-            symbol=ticker.upper(),
+            symbol=ticker_u,
             provider="sec",
             limit=50,
         )
-        df = result.to_dataframe()
-
-        if df.empty:
+        if not result.results:
             return f"No insider transactions data found for symbol '{ticker}'"
 
-        csv_string = df.to_csv()
-        header = (
-            f"# Insider Transactions data for {ticker.upper()}\n"
-            f"# Source: OpenBB (SEC)\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        )
+        csv_string = _result_to_csv(result)
+        header = _INSIDER_HEADER_TMPL % (ticker_u, _now_str())
         return header + csv_string
 
     except Exception as e:
@@ -325,6 +692,18 @@ def get_insider_transactions(
 # News Data — matches get_news_yfinance / get_global_news_yfinance signatures
 # ---------------------------------------------------------------------------
 
+def _news_column(df, columns, default):
+    """Return the first present column from ``columns`` as strings.
+
+    Falls back to a constant Series so the vectorized formatting below
+    works regardless of which column names the provider returned.
+    """
+    for col in columns:
+        if col in df.columns:
+            return df[col].fillna(default).astype(str)
+    return pd.Series(default, index=df.index)
+
+
 def get_news(
     ticker: Annotated[str, "ticker symbol"],
     start_date: Annotated[str, "start date yyyy-mm-dd"],
@@ -345,20 +724,21 @@ def get_news(
         if df.empty:
             return f"No news found for {ticker} between {start_date} and {end_date}"
 
-        news_str = ""
-        for _, row in df.iterrows():
-            title = row.get("title", "No title")
-            source = row.get("source", row.get("publisher", "Unknown"))
-            url = row.get("url", row.get("link", ""))
-            summary = row.get("text", row.get("summary", ""))
-
-            news_str += f"### {title} (source: {source})\n"
-            if summary:
-                # Truncate long summaries
-                news_str += f"{str(summary)[:500]}\n"
-            if url:
-                news_str += f"Link: {url}\n"
-            news_str += "\n"
+        # Vectorized formatting: one pandas string kernel per field instead
+        # of a Python-level loop over rows.
+        title = _news_column(df, ("title",), "No title")
+        source = _news_column(df, ("source", "publisher"), "Unknown")
+        url = _news_column(df, ("url", "link"), "")
+        # Truncate long summaries
+        summary = _news_column(df, ("text", "summary"), "").str.slice(0, 500)
+
+        blocks = (
+            "### " + title + " (source: " + source + ")\n"
+            + (summary + "\n").where(summary != "", "")
+            + ("Link: " + url + "\n").where(url != "", "")
+            + "\n"
+        )
+        news_str = blocks.str.cat()
 
         return (
             f"## {ticker} News, from {start_date} to {end_date}:\n\n"
@@ -379,7 +759,7 @@ def get_global_news(
     obb = _get_obb()
     try:
         curr_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-        start_dt = curr_dt - relativedelta(days=look_back_days)
+        start_dt = curr_dt - timedelta(days=look_back_days)
         start_date = start_dt.strftime("%Y-%m-%d")
 
         result = obb.news.world(
@@ -393,16 +773,16 @@ def get_global_news(
         if df.empty:
             return f"No global news found for {curr_date}"
 
-        news_str = ""
-        for _, row in df.iterrows():
-            title = row.get("title", "No title")
-            source = row.get("source", row.get("publisher", "Unknown"))
-            url = row.get("url", row.get("link", ""))
+        title = _news_column(df, ("title",), "No title")
+        source = _news_column(df, ("source", "publisher"), "Unknown")
+        url = _news_column(df, ("url", "link"), "")
 
-            news_str += f"### {title} (source: {source})\n"
-            if url:
-                news_str += f"Link: {url}\n"
-            news_str += "\n"
+        blocks = (
+            "### " + title + " (source: " + source + ")\n"
+            + ("Link: " + url + "\n").where(url != "", "")
+            + "\n"
+        )
+        news_str = blocks.str.cat()
 
         return (
             f"## Global Market News, from {start_date} to {curr_date}:\n\n"
@@ -418,6 +798,7 @@ def get_global_news(
 # NEW CAPABILITIES — not available in yfinance/alpha_vantage vendors
 # ===========================================================================
 
+@_cached(ttl=86400)
 def get_sec_filings(
     ticker: Annotated[str, "ticker symbol of the company"],
     filing_type: Annotated[str, "SEC filing type: 10-K, 10-Q, 8-K, etc."] = "10-K",
@@ -428,10 +809,17 @@ def get_sec_filings(
     This is a new capability not available in yfinance or alpha_vantage.
     Useful for the Fundamentals Analyst agent.
     """
+    ticker_u = ticker.upper()
+    cache_key = ("sec_filings", ticker_u, filing_type, limit)
+    if _disk_cache is not None:
+        cached = _disk_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     obb = _get_obb()
     try:
         result = obb.equity.fundamental.filings(
-            symbol=ticker.upper(),
+            symbol=ticker_u,
             type=filing_type,
             provider="sec",
             limit=limit,
@@ -441,27 +829,29 @@ def get_sec_filings(
         if df.empty:
             return f"No {filing_type} filings found for {ticker}"
 
-        lines = []
-        for _, row in df.iterrows():
-            date = row.get("filing_date", row.get("date", "Unknown"))
-            url = row.get("link", row.get("url", ""))
-            desc = row.get("description", row.get("title", filing_type))
-            lines.append(f"- [{date}] {desc}")
-            if url:
-                lines.append(f"  URL: {url}")
-
-        header = (
-            f"# SEC {filing_type} Filings for {ticker.upper()}\n"
-            f"# Source: OpenBB (SEC)\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        )
-        return header + "\n".join(lines)
+        # Resolve the alternative column names once per frame instead of
+        # probing each row; formatting is then one vectorized pass.
+        dates = _news_column(df, ("filing_date", "date"), "Unknown")
+        urls = _news_column(df, ("link", "url"), "")
+        descs = _news_column(df, ("description", "title"), filing_type)
+
+        lines = "- [" + dates + "] " + descs
+        lines = lines.where(urls == "", lines + "\n  URL: " + urls)
+
+        header = _SEC_HEADER_TMPL % (filing_type, ticker_u, _now_str())
+        payload = header + "\n".join(lines)
+
+        if _disk_cache is not None:
+            _disk_cache.set(cache_key, payload, expire=86400)
+
+        return payload
 
     except Exception as e:
         logger.warning(f"OpenBB get_sec_filings failed for {ticker}: {e}")
         return f"Error retrieving SEC filings for {ticker}: {str(e)}"
 
 
+@_cached(ttl=3600)
 def get_economic_indicators(
     indicator: Annotated[str, "FRED series ID, e.g. 'GDP', 'UNRATE', 'CPIAUCSL'"],
     start_date: Optional[str] = None,
@@ -499,12 +889,7 @@ def get_economic_indicators(
         recent = df.tail(20)
         csv_string = recent.to_csv()
 
-        header = (
-            f"# FRED Economic Data: {indicator}\n"
-            f"# Source: OpenBB (FRED)\n"
-            f"# Showing last {len(recent)} data points\n"
-            f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        )
+        header = _FRED_HEADER_TMPL % (indicator, len(recent), _now_str())
         return header + csv_string
 
     except Exception as e:
@@ -512,13 +897,15 @@ def get_economic_indicators(
         return f"Error retrieving FRED data for {indicator}: {str(e)}"
 
 
+@_cached(ttl=300)
 def get_market_overview() -> str:
     """Get a snapshot of major market indices and economic indicators.
 
-    Combines multiple data points for the Market Analyst agent.
+    Combines multiple data points for the Market Analyst agent. The
+    indices and the FRED series are each fetched in one batched request,
+    and the two requests overlap on a small thread pool.
     """
     obb = _get_obb()
-    sections = []
 
     # Major indices
     indices = ["^GSPC", "^DJI", "^IXIC", "^VIX"]
@@ -529,20 +916,6 @@ def get_market_overview() -> str:
         "^VIX": "VIX",
     }
 
-    for idx in indices:
-        try:
-            result = obb.equity.price.historical(
-                symbol=idx, provider="yfinance", limit=5
-            )
-            df = result.to_dataframe()
-            if not df.empty:
-                latest = df.iloc[-1]
-                name = index_names.get(idx, idx)
-                close = latest.get("close", "N/A")
-                sections.append(f"{name}: {close}")
-        except Exception:
-            pass
-
     # Key FRED indicators (latest values)
     fred_series = {
         "FEDFUNDS": "Fed Funds Rate",
@@ -550,25 +923,54 @@ def get_market_overview() -> str:
         "UNRATE": "Unemployment Rate",
     }
 
-    for series_id, label in fred_series.items():
-        try:
-            result = obb.economy.fred_series(symbol=series_id, provider="fred")
-            df = result.to_dataframe()
-            if not df.empty:
-                # Get the last value from the rightmost data column
-                data_cols = [c for c in df.columns if c != "date"]
-                if data_cols:
-                    val = df[data_cols[0]].iloc[-1]
-                    sections.append(f"{label}: {val}")
-        except Exception:
-            pass
+    def fetch_indices():
+        # One batched request for all four indices instead of one each.
+        result = obb.equity.price.historical(
+            symbol=",".join(indices), provider="yfinance", limit=5
+        )
+        df = result.to_dataframe()
+        if df.empty:
+            return []
+        frames = _split_by_symbol(df, indices)
+        lines = []
+        for idx, sub in frames.items():
+            if sub.empty or "close" not in sub.columns:
+                continue
+            name = index_names.get(idx, idx)
+            lines.append(f"{name}: {sub['close'].iloc[-1]}")
+        return lines
+
+    def fetch_fred():
+        # One batched request for all three series; FRED returns a wide
+        # frame with one column per series ID.
+        result = obb.economy.fred_series(
+            symbol=",".join(fred_series), provider="fred"
+        )
+        df = result.to_dataframe()
+        if df.empty:
+            return []
+        lines = []
+        for series_id, label in fred_series.items():
+            col = df.get(series_id)
+            if col is None:
+                continue
+            col = col.dropna()
+            if not col.empty:
+                lines.append(f"{label}: {col.iloc[-1]}")
+        return lines
+
+    sections = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        index_future = executor.submit(fetch_indices)
+        fred_future = executor.submit(fetch_fred)
+        for future in (index_future, fred_future):
+            try:
+                sections.extend(future.result())
+            except Exception:
+                pass  # Each data point is best-effort, as before
 
     if not sections:
         return "Unable to retrieve market overview data"
 
-    header = (
-        f"# Market Overview\n"
-        f"# Source: OpenBB\n"
-        f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    )
+    header = _OVERVIEW_HEADER_TMPL % (_now_str(),)
     return header + "\n".join(sections)
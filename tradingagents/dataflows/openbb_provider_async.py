@@ -0,0 +1,80 @@
+"""Async variants of the OpenBB provider functions.
+
+The OpenBB SDK itself is synchronous, so each ``aget_*`` coroutine runs
+its sync counterpart in a worker thread via ``asyncio.to_thread``. That
+keeps the event loop free during the HTTP round-trip, which is what an
+agent loop actually needs: several independent fetches for one ticker can
+run concurrently with ``asyncio.gather`` instead of back-to-back.
+
+A per-event-loop semaphore bounds how many provider calls are in flight
+at once so a burst of agents cannot open an unbounded number of
+connections.
+"""
+
+import asyncio
+import weakref
+from functools import wraps
+
+from . import openbb_provider as _sync
+
+# Bound concurrent provider calls per event loop.
+_MAX_CONCURRENT_CALLS = 8
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore():
+    # asyncio primitives bind to the loop they are first awaited on, so a
+    # single shared semaphore would raise "bound to a different event
+    # loop" on the next asyncio.run(). Keep one per running loop; the
+    # weak keys let entries for finished loops be collected.
+    loop = asyncio.get_running_loop()
+    sem = _semaphores.get(loop)
+    if sem is None:
+        sem = _semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+    return sem
+
+
+def _async_variant(sync_func):
+    """Wrap a sync provider function as a semaphore-gated coroutine."""
+    @wraps(sync_func)
+    async def wrapper(*args, **kwargs):
+        async with _get_semaphore():
+            return await asyncio.to_thread(sync_func, *args, **kwargs)
+    wrapper.__name__ = f"a{sync_func.__name__}"
+    wrapper.__qualname__ = wrapper.__name__
+    return wrapper
+
+
+aget_stock_data = _async_variant(_sync.get_stock_data)
+aget_indicators = _async_variant(_sync.get_indicators)
+aget_fundamentals = _async_variant(_sync.get_fundamentals)
+aget_balance_sheet = _async_variant(_sync.get_balance_sheet)
+aget_cashflow = _async_variant(_sync.get_cashflow)
+aget_income_statement = _async_variant(_sync.get_income_statement)
+aget_insider_transactions = _async_variant(_sync.get_insider_transactions)
+aget_news = _async_variant(_sync.get_news)
+aget_global_news = _async_variant(_sync.get_global_news)
+aget_sec_filings = _async_variant(_sync.get_sec_filings)
+aget_economic_indicators = _async_variant(_sync.get_economic_indicators)
+aget_market_overview = _async_variant(_sync.get_market_overview)
+
+
+async def aget_financials(ticker: str, freq: str = "quarterly") -> dict:
+    """Fetch fundamentals and all three statements for one ticker at once.
+
+    Returns a dict keyed by report name; the four requests overlap instead
+    of running sequentially, so the wall-clock cost is roughly one
+    round-trip instead of four.
+    """
+    fundamentals, balance, cashflow, income = await asyncio.gather(
+        aget_fundamentals(ticker),
+        aget_balance_sheet(ticker, freq),
+        aget_cashflow(ticker, freq),
+        aget_income_statement(ticker, freq),
+    )
+    return {
+        "fundamentals": fundamentals,
+        "balance_sheet": balance,
+        "cashflow": cashflow,
+        "income_statement": income,
+    }
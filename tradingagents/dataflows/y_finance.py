@@ -157,22 +157,23 @@ def get_stock_stats_indicators_window(
             date_values.append((date_str, indicator_value))
             current_dt = current_dt - relativedelta(days=1)
         
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
+        # Build the result string — accumulate in a list and join once so
+        # the cost stays linear instead of re-copying the string each pass
+        parts = [f"{date_str}: {value}\n" for date_str, value in date_values]
+        ind_string = "".join(parts)
         
     except Exception as e:
         print(f"Error getting bulk stockstats data: {e}")
         # Fallback to original implementation if bulk method fails
-        ind_string = ""
+        parts = []
         curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
         while curr_date_dt >= before:
             indicator_value = get_stockstats_indicator(
                 symbol, indicator, curr_date_dt.strftime("%Y-%m-%d")
             )
-            ind_string += f"{curr_date_dt.strftime('%Y-%m-%d')}: {indicator_value}\n"
+            parts.append(f"{curr_date_dt.strftime('%Y-%m-%d')}: {indicator_value}\n")
             curr_date_dt = curr_date_dt - relativedelta(days=1)
+        ind_string = "".join(parts)
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
@@ -184,6 +185,12 @@ def get_stock_stats_indicators_window(
     return result_str
 
 
+# In-process memo of downloaded OHLCV frames shared across indicator
+# calls, keyed (symbol, start, end). Copies are handed out because
+# stockstats mutates the frame it wraps.
+_ohlcv_memo = {}
+
+
 def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
@@ -231,9 +238,15 @@ def _get_stock_stats_bulk(
             f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
         )
         
-        if os.path.exists(data_file):
+        memo_key = (symbol, start_date_str, end_date_str)
+        if memo_key in _ohlcv_memo:
+            # Same window already downloaded this process; skip the disk
+            # read and the network entirely.
+            data = _ohlcv_memo[memo_key].copy()
+        elif os.path.exists(data_file):
             data = pd.read_csv(data_file)
             data["Date"] = pd.to_datetime(data["Date"])
+            _ohlcv_memo[memo_key] = data.copy()
         else:
             data = yf.download(
                 symbol,
@@ -245,6 +258,7 @@ def _get_stock_stats_bulk(
             )
             data = data.reset_index()
             data.to_csv(data_file, index=False)
+            _ohlcv_memo[memo_key] = data.copy()
         
         df = wrap(data)
         df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")